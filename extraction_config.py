@@ -14,55 +14,58 @@ LONG_QUESTION_THRESHOLD = 200  # Question length for difficulty +1
 LONG_EXPLANATION_THRESHOLD = 500  # Explanation length for difficulty +1
 
 # Valid CAPM ECO Domains
-VALID_TOPICS = [
+VALID_TOPICS = (
     "Project Management Fundamentals and Core Concepts",
     "Predictive, Plan-Based Methodologies",
     "Agile Frameworks/Methodologies",
     "Business Analysis Frameworks",
-]
+)
 
-# Topic Classification Keywords
-AGILE_KEYWORDS = [
+# Topic Classification Keywords (tuples: immutable, shared as-is across forked workers).
+# Reference vocabulary only: the extractor runs standalone and keeps its own
+# keyword tuples and matchers in scripts/extract_questions.py.
+AGILE_KEYWORDS = (
     'scrum', 'sprint', 'agile', 'kanban', 'retrospective',
     'product owner', 'scrum master', 'user story', 'backlog',
     'iteration', 'adaptive', 'daily standup', 'velocity',
     'burndown', 'mvp', 'minimum viable product', 'story points',
     'sprint planning', 'sprint review', 'incremental',
-]
+)
 
-PREDICTIVE_KEYWORDS = [
+PREDICTIVE_KEYWORDS = (
     'waterfall', 'predictive', 'wbs', 'work breakdown',
     'gantt', 'critical path', 'baseline', 'change control board',
     'traditional', 'plan-driven', 'earned value', 'pert',
     'schedule compression', 'fast tracking', 'crashing',
-]
+)
 
-BUSINESS_ANALYSIS_KEYWORDS = [
+BUSINESS_ANALYSIS_KEYWORDS = (
     'requirements', 'business case', 'roi', 'stakeholder analysis',
     'swot', 'traceability matrix', 'elicitation', 'moscow',
     'weighted ranking', 'business analyst', 'feasibility',
     'benefit-cost ratio', 'payback period', 'npv', 'irr',
-]
+)
 
 # Difficulty Estimation Keywords
-COMPLEX_KEYWORDS = [
+COMPLEX_KEYWORDS = (
     'root cause', 'best practice', 'most appropriate',
     'complex', 'integrate', 'conflict', 'hybrid',
     'negotiate', 'optimize', 'prioritize', 'balance',
-]
+)
 
 # Difficulty Score Thresholds
 DIFFICULTY_EASY_MAX = 1
 DIFFICULTY_MEDIUM_MAX = 3
 # Score > DIFFICULTY_MEDIUM_MAX is 'hard'
 
-# Regex Patterns (for reference/documentation)
+# Regex Patterns (for reference/documentation; the compiled patterns that
+# run are owned by scripts/extract_questions.py)
 QUESTION_PATTERN = r"^\s*(?:\d+\s+)?(\d+)\s*[\)\.-]\s*(.*)"
 OPTION_PATTERN = r"^\s*([A-G])\s*[\)\.:]\s*(.+)"
 ANSWER_PATTERN = r"^(\d+)\s*[\.)-]?\s+([A-G](?:\s*,\s*[A-G])*)(?:\s+(.+))?$"
 PAGE_FOOTER_PATTERN = r"\b\d{1,4}\s*/\s*\d{1,4}\b$"
 
 # Special Case Detection
-HEADER_SKIP_PATTERNS = ["options", "option", "answer choices", "answers"]
-IMAGE_MARKERS = ["<<IMAGE>>", "drag and drop", "image", "diagram"]
+HEADER_SKIP_PATTERNS = ("options", "option", "answer choices", "answers")
+IMAGE_MARKERS = ("<<IMAGE>>", "drag and drop", "image", "diagram")
 MULTI_SELECT_PATTERN = r"\(choose\s+(two|three)\)"
@@ -1,24 +1,40 @@
 #!/usr/bin/env python3
 """CI validation helper: run validate_json_output() on combined outputs and fail if issues found."""
 from __future__ import annotations
-import glob
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 
-from scripts.extract_questions import validate_json_output
+from scripts.extract_questions import collect_validation_issues, report_validation
+
+MAX_WORKERS = 8
+
+
+def _find_combined(dir_: str = 'output') -> List[str]:
+    """Return sorted paths of CAPM_*_All.json files in dir_ (empty if dir_ is missing)."""
+    try:
+        with os.scandir(dir_) as it:
+            return sorted(e.path for e in it if e.name.startswith('CAPM_') and e.name.endswith('_All.json'))
+    except FileNotFoundError:
+        return []
 
 
 def main():
     # Prefer the combined all-tests file if present
-    candidates = glob.glob(os.path.join('output', 'CAPM_*_All.json'))
+    candidates = _find_combined()
     if not candidates:
         print('(ci-validate) No combined JSON files found in output/; skipping validation.')
         return 0
 
+    # Load and check files concurrently, then report in path order so output stays stable
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(candidates))) as ex:
+        results = list(zip(candidates, ex.map(collect_validation_issues, candidates)))
+
     all_ok = True
-    for p in sorted(candidates):
-        ok = validate_json_output(p)
+    for p, issues in results:
+        ok = report_validation(p, issues)
         if not ok:
             all_ok = False
 
@@ -1,18 +1,272 @@
 #!/usr/bin/env python3
-import argparse
-import glob
-import json
+import hashlib
+import mmap
 import os
-import re
-from typing import List, Dict, Any, Iterable
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
+from typing import List, Dict, Any, Deque, Iterable, Iterator, Optional, Tuple
 
+# orjson is optional; fall back to the stdlib encoder/decoder when it's absent.
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    import json
+    orjson = None
 
-def combine_batches(test_name: str, output_dir: str = "output") -> str:
+BATCH_PREFIX = "CAPM_"
+RANGE_MARKER = "_Questions_"
+_PREFIX_LEN = len(BATCH_PREFIX)
+_MARKER_LEN = len(RANGE_MARKER)
+# Below this many files, thread start-up costs more than overlapping the reads saves.
+PARALLEL_LOAD_MIN_FILES = 4
+MAX_LOAD_WORKERS = 8
+# mmap only pays for itself on large files; extractor batches (~15 items, tens of KB)
+# are faster to read with one sized os.read.
+MMAP_MIN_BYTES = 1 << 20
+
+
+def _iter_batch_entries(output_dir: str, prefix: str = BATCH_PREFIX) -> Iterator[Tuple[str, str, int, int]]:
+    """Yield (path, test_segment, start, end) for each batch file in output_dir.
+
+    Uses a single os.scandir pass with plain string checks instead of glob + regex.
+    Files whose name starts with `prefix` but carries no numeric range are ignored.
+    A missing output_dir yields nothing.
+    """
+    try:
+        it = os.scandir(output_dir)
+    except FileNotFoundError:
+        return
+    with it:
+        for e in it:
+            n = e.name
+            if not (n.startswith(prefix) and n.endswith(".json")):
+                continue
+            stem = n[:-5]
+            cut = stem.rfind(RANGE_MARKER)
+            if cut <= _PREFIX_LEN:
+                continue
+            lo, _, hi = stem[cut + _MARKER_LEN:].partition("-")
+            if not (lo.isdigit() and hi.isdigit()):
+                continue
+            yield e.path, stem[_PREFIX_LEN:cut], int(lo), int(hi)
+
+
+def _loads(raw: bytes) -> Any:
+    """Decode JSON bytes using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode obj as 2-space indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _dumps_element(obj: Any) -> bytes:
+    """Encode obj indented one level, as an element of a 2-space indented array."""
+    # Raw newlines only occur between tokens (string contents are escaped), so this is safe
+    return b'  ' + _dumps(obj).replace(b'\n', b'\n  ')
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Encode obj as compact single-line UTF-8 JSON bytes (for JSON Lines output)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _read_fd(fd: int, size: int) -> bytes:
+    """Read an open file with raw os calls: one sized read, then drain in case it grew.
+
+    Skips the buffered file object and its extra seek/read round-trips, which
+    add up when combining many small batch files.
+    """
+    chunks = [os.read(fd, size or 65536)]
+    while chunks[-1]:
+        chunks.append(os.read(fd, 65536))
+    return b''.join(chunks)
+
+
+def _load_file(path: str) -> Any:
+    """Parse a JSON file, from a read-only mmap when it is large enough to be worth it.
+
+    With orjson and at least MMAP_MIN_BYTES, the page cache backs the buffer so
+    no bytes copy of the file is made; smaller files take one sized read.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        if orjson is not None and size >= MMAP_MIN_BYTES:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return _loads(_read_fd(fd, size))
+    finally:
+        os.close(fd)
+
+
+def _load_batch(path: str) -> List[Dict[str, Any]]:
+    """Read and parse one batch file, checking that its root is a list."""
+    data = _load_file(path)
+    if not isinstance(data, list):
+        raise ValueError(f"Unexpected JSON root in {path}, expected a list")
+    return data
+
+
+def _load_batches(paths: List[str]) -> Iterator[List[Dict[str, Any]]]:
+    """Yield parsed batches in the order of `paths`, reading them concurrently when worthwhile.
+
+    At most 2 x workers reads are in flight, so memory stays bounded by that
+    window rather than growing with the number of files.
+    """
+    if len(paths) < PARALLEL_LOAD_MIN_FILES:
+        for p in paths:
+            yield _load_batch(p)
+        return
+    workers = min(MAX_LOAD_WORKERS, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        pending: Deque[Future] = deque()
+        it = iter(paths)
+        for p in islice(it, 2 * workers):
+            pending.append(ex.submit(_load_batch, p))
+        while pending:
+            data = pending.popleft().result()
+            for p in islice(it, 1):
+                pending.append(ex.submit(_load_batch, p))
+            yield data
+
+
+def _iter_items(jobs: List[Tuple[str, str]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (test_name, item) from (test_name, path) jobs in order, with a bounded read-ahead window."""
+    batches = _load_batches([p for _, p in jobs])
+    for (test_name, _), data in zip(jobs, batches):
+        for item in data:
+            yield test_name, item
+
+
+class _OutputWriter:
+    """Incremental writer for a JSON array or JSON Lines file.
+
+    Items are encoded as they arrive, so callers never hold the full output.
+    compact=True drops the array's indentation (ignored for JSON Lines).
+    Output goes to `<out_path>.tmp` and replaces out_path only on close(); if
+    the block raises, abort() discards it and the previous output is kept.
+    """
+
+    def __init__(self, out_path: str, jsonl: bool = False, compact: bool = False):
+        self.out_path = out_path
+        self.jsonl = jsonl
+        self.n_items = 0
+        if jsonl:
+            self._encode, self._sep, self._first, self._last = _dumps_line, b'', b'', b''
+        elif compact:
+            self._encode, self._sep, self._first, self._last = _dumps_line, b',', b'', b']'
+        else:
+            self._encode, self._sep, self._first, self._last = _dumps_element, b',\n', b'\n', b'\n]'
+        self._tmp_path = f"{out_path}.tmp"
+        self._f = open(self._tmp_path, 'wb')
+        if not jsonl:
+            self._f.write(b'[')
+
+    def write(self, item: Dict[str, Any]) -> None:
+        self._f.write(self._sep if self.n_items else self._first)
+        self._f.write(self._encode(item))
+        if self.jsonl:
+            self._f.write(b'\n')
+        self.n_items += 1
+
+    def close(self) -> None:
+        """Finish the file and move it into place."""
+        self._f.write(self._last)
+        self._f.close()
+        os.replace(self._tmp_path, self.out_path)
+
+    def abort(self) -> None:
+        """Drop the partial output, leaving any existing out_path untouched."""
+        self._f.close()
+        try:
+            os.remove(self._tmp_path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "_OutputWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def _combined_path(test_name: str, output_dir: str, jsonl: bool) -> str:
+    ext = "jsonl" if jsonl else "json"
+    return os.path.join(output_dir, f"CAPM_{test_name.replace(' ', '_')}_All.{ext}")
+
+
+def _batch_files_for(test_name: str, output_dir: str) -> List[str]:
+    """Return batch file paths for a test, sorted by (start, end) question range."""
+    prefix = f"{BATCH_PREFIX}{test_name.replace(' ', '_')}{RANGE_MARKER}"
+    entries = [(p, lo, hi) for p, _, lo, hi in _iter_batch_entries(output_dir, prefix)]
+    entries.sort(key=itemgetter(1, 2))
+    return [p for p, _, _ in entries]
+
+
+def _batch_fingerprint(paths: List[str]) -> str:
+    """Hash the (path, size, mtime_ns) of each input so unchanged batch sets can be detected."""
+    h = hashlib.sha256()
+    for p in paths:
+        st = os.stat(p)
+        h.update(f"{p}|{st.st_size}|{st.st_mtime_ns}\n".encode('utf-8'))
+    return h.hexdigest()
+
+
+def _read_cache_key(cache_path: str) -> str:
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def _cache_key(files: List[str], compact: bool) -> str:
+    return f"{_batch_fingerprint(files)}:{'compact' if compact else 'indent'}"
+
+
+def _write_cache_key(cache_path: str, key: str) -> None:
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        f.write(key)
+
+
+def _drop_cache_key(cache_path: str) -> None:
+    """Invalidate a sidecar before its output is rewritten, so a failed write can't look current."""
+    try:
+        os.remove(cache_path)
+    except FileNotFoundError:
+        pass
+
+
+def combine_batches(
+    test_name: str,
+    output_dir: str = "output",
+    use_cache: bool = True,
+    jsonl: bool = False,
+    compact: bool = False,
+) -> str:
     """Combine batch JSONs for a single test into one consolidated file.
     
     Args:
         test_name: Name of the test (e.g., 'Practice Test 2')
         output_dir: Directory containing batch JSON files (default: 'output')
+        use_cache: Skip the rewrite when the batch files are unchanged since the
+            last combine (tracked in a `<output>.combine.cache` sidecar)
+        jsonl: Write JSON Lines (`_All.jsonl`, one object per line) instead of
+            an indented JSON array
+        compact: Write the JSON array without indentation (ignored with jsonl)
         
     Returns:
         Path to the combined JSON file
@@ -25,34 +279,26 @@ def combine_batches(test_name: str, output_dir: str = "output") -> str:
         >>> combine_batches('Practice Test 2')
         'output/CAPM_Practice_Test_2_All.json'
     """
-    prefix = f"CAPM_{test_name.replace(' ', '_')}_Questions_"
-    pattern = os.path.join(output_dir, f"{prefix}*.json")
-    files = glob.glob(pattern)
+    files = _batch_files_for(test_name, output_dir)
     if not files:
+        pattern = os.path.join(output_dir, f"CAPM_{test_name.replace(' ', '_')}_Questions_*.json")
         raise FileNotFoundError(f"No files matched pattern: {pattern}")
 
-    # Extract numeric ranges and sort by start
-    def parse_range(path: str):
-        name = os.path.basename(path)
-        m = re.search(r"Questions_(\d+)-(\d+)\.json$", name)
-        if not m:
-            return (10**9, 10**9)
-        return (int(m.group(1)), int(m.group(2)))
-
-    files.sort(key=parse_range)
-
-    combined: List[Dict[str, Any]] = []
-    for p in files:
-        with open(p, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            if not isinstance(data, list):
-                raise ValueError(f"Unexpected JSON root in {p}, expected a list")
-            combined.extend(data)
-
-    out_path = os.path.join(output_dir, f"CAPM_{test_name.replace(' ', '_')}_All.json")
-    with open(out_path, 'w', encoding='utf-8') as f:
-        json.dump(combined, f, indent=2, ensure_ascii=False)
-    print(f"Combined {len(files)} files -> {out_path} ({len(combined)} items)")
+    out_path = _combined_path(test_name, output_dir, jsonl)
+    cache_path = f"{out_path}.combine.cache"
+    key = _cache_key(files, compact)
+    if use_cache and os.path.exists(out_path) and _read_cache_key(cache_path) == key:
+        print(f"Up to date: {out_path} ({len(files)} files unchanged)")
+        return out_path
+
+    _drop_cache_key(cache_path)
+    with _OutputWriter(out_path, jsonl, compact) as out:
+        for _, item in _iter_items([(test_name, p) for p in files]):
+            out.write(item)
+    n_items = out.n_items
+    # Only after the new output has replaced the old one
+    _write_cache_key(cache_path, key)
+    print(f"Combined {len(files)} files -> {out_path} ({n_items} items)")
     return out_path
 
 
@@ -72,81 +318,107 @@ def detect_tests_in_output(output_dir: str = "output") -> List[str]:
         >>> detect_tests_in_output()
         ['Practice Test 2', 'Practice Test 3']
     """
-    paths = glob.glob(os.path.join(output_dir, "CAPM_*_Questions_*.json"))
-    names = set()
-    for p in paths:
-        base = os.path.basename(p)
-        m = re.match(r"CAPM_(.+?)_Questions_\d+-\d+\.json$", base)
-        if m:
-            underscored = m.group(1)
-            names.add(underscored.replace('_', ' '))
+    names = {seg.replace('_', ' ') for _, seg, _, _ in _iter_batch_entries(output_dir)}
     return sorted(names)
 
 
-def combine_all_tests(test_names: Iterable[str], output_dir: str = "output") -> str:
+def combine_all_tests(
+    test_names: Iterable[str],
+    output_dir: str = "output",
+    jsonl: bool = False,
+    compact: bool = True,
+    per_test: bool = False,
+) -> str:
     """Combine batches across multiple tests into a single JSON file.
 
-    Adds a `testName` field to each item.
-    """
-    all_items: List[Dict[str, Any]] = []
-    total_files = 0
+    Adds a `testName` field to each item. Items are streamed from the batch
+    files straight into the output, so the combined list is never built.
+    With jsonl=True the output is `CAPM_All_Tests.jsonl`, one object per line.
+    The JSON array is written compact by default since this file is mostly
+    machine-consumed; pass compact=False for an indented, reviewable file.
 
+    With per_test=True each test's `CAPM_<test>_All.json` (as combine_batches
+    would write it) is emitted in the same pass, so no batch is parsed twice.
+    """
+    test_names = list(test_names)  # may be a one-shot iterable; it's counted again below
+    files_by_test: Dict[str, List[str]] = {}
+    jobs: List[Tuple[str, str]] = []
     for test_name in test_names:
-        prefix = f"CAPM_{test_name.replace(' ', '_')}_Questions_"
-        pattern = os.path.join(output_dir, f"{prefix}*.json")
-        files = glob.glob(pattern)
-        if not files:
-            continue
-
-        def parse_range(path: str):
-            name = os.path.basename(path)
-            m = re.search(r"Questions_(\d+)-(\d+)\.json$", name)
-            if not m:
-                return (10**9, 10**9)
-            return (int(m.group(1)), int(m.group(2)))
-
-        files.sort(key=parse_range)
-        total_files += len(files)
-
-        for p in files:
-            with open(p, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if not isinstance(data, list):
-                    raise ValueError(f"Unexpected JSON root in {p}, expected a list")
-                for item in data:
-                    item_with_test = dict(item)
-                    item_with_test['testName'] = test_name
-                    all_items.append(item_with_test)
-
-    if not all_items:
-        raise FileNotFoundError("No batch files found for the specified tests.")
-
-    out_path = os.path.join(output_dir, "CAPM_All_Tests.json")
-    with open(out_path, 'w', encoding='utf-8') as f:
-        json.dump(all_items, f, indent=2, ensure_ascii=False)
-    print(f"Combined {total_files} files across {len(list(test_names))} tests -> {out_path} ({len(all_items)} items)")
+        files = _batch_files_for(test_name, output_dir)
+        if files:
+            files_by_test[test_name] = files
+            jobs.extend((test_name, p) for p in files)
+    total_files = len(jobs)
+
+    out_path = os.path.join(output_dir, "CAPM_All_Tests.jsonl" if jsonl else "CAPM_All_Tests.json")
+    current: Optional[str] = None
+    test_out: Optional[_OutputWriter] = None
+
+    def finish_test_out() -> None:
+        if test_out is not None:
+            test_out.close()
+            # Keep combine_batches' cache in sync so a later --test run is a no-op
+            _write_cache_key(f"{test_out.out_path}.combine.cache", _cache_key(files_by_test[current], False))
+
+    with _OutputWriter(out_path, jsonl, compact) as out:
+        try:
+            for test_name, item in _iter_items(jobs):
+                if per_test and test_name != current:
+                    finish_test_out()
+                    current = test_name
+                    _drop_cache_key(f"{_combined_path(test_name, output_dir, jsonl)}.combine.cache")
+                    test_out = _OutputWriter(_combined_path(test_name, output_dir, jsonl), jsonl)
+                if test_out is not None:
+                    test_out.write(item)
+                # Batches are freshly decoded and not referenced elsewhere, so tag in place
+                item['testName'] = test_name
+                out.write(item)
+        except BaseException:
+            if test_out is not None:
+                test_out.abort()
+            raise
+        finish_test_out()
+        if not out.n_items:
+            raise FileNotFoundError("No batch files found for the specified tests.")
+    n_items = out.n_items
+
+    print(f"Combined {total_files} files across {len(test_names)} tests -> {out_path} ({n_items} items)")
     return out_path
 
 
 def main():
+    import argparse  # CLI-only; keep library imports of this module light
+
     parser = argparse.ArgumentParser(description="Combine batch JSON files into consolidated JSON(s)")
     group = parser.add_mutually_exclusive_group(required=True)
     group.add_argument('--test', help='Single test name, e.g. "Practice Test 2"')
     group.add_argument('--tests', nargs='+', help='Multiple test names to combine into one file')
     group.add_argument('--all-tests', action='store_true', help='Auto-detect tests from output files and combine all')
     parser.add_argument('--output-dir', default='output', help='Directory containing batch JSON files')
+    parser.add_argument('--no-cache', action='store_true', help='Always rewrite the combined file, even if batches are unchanged')
+    parser.add_argument('--jsonl', action='store_true', help='Write JSON Lines (one compact object per line) instead of a JSON array')
+    parser.add_argument('--compact', action=argparse.BooleanOptionalAction, default=None,
+                        help='Write the JSON array without indentation (default: on for multi-test output, off for --test or a single --tests name)')
     args = parser.parse_args()
 
+    # None lets each combine function apply its own default
+    fmt = {'jsonl': args.jsonl}
+    if args.compact is not None:
+        fmt['compact'] = args.compact
+
     if args.test:
-        combine_batches(args.test, args.output_dir)
+        combine_batches(args.test, args.output_dir, use_cache=not args.no_cache, **fmt)
+    elif args.tests and len(args.tests) == 1:
+        # Single name: no cross-test tagging needed, use the per-test path (and its cache)
+        combine_batches(args.tests[0], args.output_dir, use_cache=not args.no_cache, **fmt)
     elif args.tests:
-        combine_all_tests(args.tests, args.output_dir)
+        combine_all_tests(args.tests, args.output_dir, **fmt)
     elif args.all_tests:
         detected = detect_tests_in_output(args.output_dir)
         if not detected:
             raise SystemExit("No tests detected in output/. Generate batches first.")
         print(f"Detected tests: {', '.join(detected)}")
-        combine_all_tests(detected, args.output_dir)
+        combine_all_tests(detected, args.output_dir, per_test=True, **fmt)
 
 
 if __name__ == '__main__':
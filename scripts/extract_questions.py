@@ -14,19 +14,47 @@ incrementally following the OpenSpec tasks.
 from __future__ import annotations
 
 import argparse
+import contextlib
 import glob
+import hashlib
+import io
 import json
 import os
 import re
-from typing import Dict, List, Any, Optional, Tuple
+import sqlite3
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Dict, List, Any, Optional, Tuple
 
 # Note: PDF libraries are imported lazily inside functions to avoid hard dependency for dry runs.
 
+# pyahocorasick is optional; keyword checks fall back to compiled alternation regexes.
+try:
+    import ahocorasick  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    ahocorasick = None
+
+# orjson is optional; the stdlib encoder is used for batch files when it's absent.
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+# xxhash is optional; blake2b (stdlib) is used for cache keys when it's absent.
+try:
+    import xxhash  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    xxhash = None
+
 # Constants
 DEFAULT_BATCH_SIZE = 15
 MIN_EXPLANATION_LENGTH = 100
 LONG_QUESTION_THRESHOLD = 200
 LONG_EXPLANATION_THRESHOLD = 500
+# Threads used to write a test's batch files (I/O bound, so the GIL is released)
+MAX_WRITE_WORKERS = 4
 
 VALID_TOPICS = [
     "Project Management Fundamentals and Core Concepts",
@@ -35,6 +63,253 @@ VALID_TOPICS = [
     "Business Analysis Frameworks",
 ]
 
+# Validation lookups, built once rather than per item
+_VALID_TOPICS = frozenset(VALID_TOPICS)
+_VALID_DIFFICULTY = frozenset({"easy", "medium", "hard"})
+_REQUIRED_FIELDS = ("text", "options", "correctAnswer", "explanation", "topic", "difficulty")
+_TEXT_PREFIX = "[Practice Test"
+
+# Line patterns and classification keywords below are owned by this module (it runs as a
+# standalone script); extraction_config.py keeps reference copies that are not imported.
+# Line patterns, compiled once at import.
+# Allow optional leading page/line numbers and different delimiters for questions
+# Examples matched: "18) ...", "18 . ...", "18- ...", and lines like "18 18) ..."
+_Q_RE = re.compile(r"^\s*(?:\d+\s+)?(\d+)\s*[\)\.-]\s*(.*)")
+# Accept A) A. A: variants, with optional leading spaces
+_OPT_RE = re.compile(r"^\s*([A-G])\s*[\)\.:]\s*(.+)")
+# Answer heads: "51 C ...", "51) C ...", "51. C ...", multi answers "A, B, C", or bare "33 C"
+_HEAD_RE = re.compile(r"^(\d+)\s*[\.)-]?\s+([A-G](?:\s*,\s*[A-G])*)(?:\s+(.+))?$")
+# Multi-select markers: "(Choose two)", "(choose three)"
+_CHOOSE_RE = re.compile(r"\(choose\s+(two|three)\)", re.IGNORECASE)
+# Page footer artifacts like "41/117" at end of line
+_FOOTER_RE = re.compile(r"\b\d{1,4}\s*/\s*\d{1,4}\b$")
+
+# Classification keywords (matched as substrings of lowercased text)
+AGILE_KEYWORDS = (
+    'scrum', 'sprint', 'agile', 'kanban', 'retrospective',
+    'product owner', 'scrum master', 'user story', 'backlog',
+    'iteration', 'adaptive', 'daily standup', 'velocity',
+    'burndown', 'mvp', 'minimum viable product'
+)
+
+PREDICTIVE_KEYWORDS = (
+    'waterfall', 'predictive', 'wbs', 'work breakdown',
+    'gantt', 'critical path', 'baseline', 'change control board',
+    'traditional', 'plan-driven'
+)
+
+BA_KEYWORDS = (
+    'requirements', 'business case', 'roi', 'stakeholder analysis',
+    'swot', 'traceability matrix', 'elicitation', 'moscow',
+    'weighted ranking', 'business analyst', 'feasibility'
+)
+
+COMPLEX_KEYWORDS = (
+    'root cause', 'best practice', 'most appropriate',
+    'complex', 'integrate', 'conflict', 'hybrid'
+)
+
+
+def _keyword_re(keywords: Tuple[str, ...]) -> "re.Pattern[str]":
+    # One alternation scans the text once instead of one `in` test per keyword.
+    # No IGNORECASE: callers pass lowercased text.
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+_AGILE_RE = _keyword_re(AGILE_KEYWORDS)
+_PREDICTIVE_RE = _keyword_re(PREDICTIVE_KEYWORDS)
+_BA_RE = _keyword_re(BA_KEYWORDS)
+_COMPLEX_RE = _keyword_re(COMPLEX_KEYWORDS)
+
+_KEYWORD_GROUPS = (
+    ("agile", AGILE_KEYWORDS, _AGILE_RE),
+    ("predictive", PREDICTIVE_KEYWORDS, _PREDICTIVE_RE),
+    ("ba", BA_KEYWORDS, _BA_RE),
+    ("complex", COMPLEX_KEYWORDS, _COMPLEX_RE),
+)
+
+
+def _build_keyword_automaton():
+    """One Aho-Corasick automaton over every keyword group (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for tag, keywords, _ in _KEYWORD_GROUPS:
+        for kw in keywords:
+            automaton.add_word(kw, automaton.get(kw, ()) + (tag,))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AC = _build_keyword_automaton()
+
+
+def _keyword_tags(text_lower: str) -> set:
+    """Return the keyword groups ('agile', 'predictive', 'ba', 'complex') present in the text."""
+    if _KEYWORD_AC is not None:
+        tags: set = set()
+        for _, kw_tags in _KEYWORD_AC.iter(text_lower):
+            tags.update(kw_tags)
+        return tags
+    return {tag for tag, _, pattern in _KEYWORD_GROUPS if pattern.search(text_lower)}
+
+# Bump whenever classify_topic/estimate_difficulty *code* changes. Edits to the
+# keyword tuples or length thresholds are picked up by _classifier_fingerprint().
+CLASSIFIER_VERSION = 1
+DEFAULT_CLASSIFY_CACHE = os.path.join('output', '.classify.cache.sqlite')
+
+
+def _pages_pypdfium2(pdf_path: str):
+    import pypdfium2 as pdfium  # type: ignore
+
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for page in pdf:
+            textpage = page.get_textpage()
+            try:
+                yield textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+    finally:
+        pdf.close()
+
+
+def _pages_pymupdf(pdf_path: str):
+    try:
+        import pymupdf  # type: ignore
+    except ImportError:
+        import fitz as pymupdf  # type: ignore  # pre-1.24 module name
+
+    with pymupdf.open(pdf_path) as doc:
+        for page in doc:
+            yield page.get_text()
+
+
+def _pages_pdfplumber(pdf_path: str):
+    import pdfplumber  # type: ignore
+
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            yield page.extract_text() or ""
+
+
+def _pages_pypdf(pdf_path: str):
+    from pypdf import PdfReader  # type: ignore
+
+    reader = PdfReader(pdf_path)
+    for page in reader.pages:
+        yield page.extract_text() or ""
+
+
+# Text-only extraction: C-backed parsers first; pdfplumber's layout analysis isn't used here.
+_PDF_BACKENDS = (
+    ("pypdfium2", _pages_pypdfium2),
+    ("pymupdf", _pages_pymupdf),
+    ("pdfplumber", _pages_pdfplumber),
+    ("pypdf", _pages_pypdf),
+)
+
+
+def _iter_pdf_lines(pdf_path: str, problems: List[str]):
+    """
+    Yield raw text lines from a PDF one page at a time instead of buffering the document.
+
+    Tries each parser in _PDF_BACKENDS order, moving on if one is not installed or
+    can't open the file. Parse failures are appended to `problems` (so callers can
+    report them under their own label); if no parser works, nothing is yielded.
+    """
+    errors: List[str] = []
+    for name, pages in _PDF_BACKENDS:
+        yielded = False
+        try:
+            for page_text in pages(pdf_path):
+                for ln in page_text.splitlines():
+                    yielded = True
+                    yield ln
+            return
+        except Exception as e:
+            if yielded:
+                # Lines were already consumed; restarting with another parser would duplicate them
+                problems.append(f"{name} failed mid-document: {e}")
+                return
+            errors.append(f"{name}: {e}")
+
+    problems.append(f"Could not parse PDF with any available parser: {' / '.join(errors)}")
+
+
+def _iter_clean_lines(lines):
+    """
+    Yield normalized, non-blank content lines in a single pass.
+
+    Collapses whitespace runs, strips page footer artifacts like "41/117" at the
+    end of a line, and drops lines left empty.
+    """
+    for ln in lines:
+        # split()/join collapses the same whitespace set as \s+ without the regex engine
+        s = " ".join(ln.split())
+        if not s:
+            continue
+        s = _FOOTER_RE.sub("", s).rstrip()
+        if s:
+            yield s
+
+
+@lru_cache(maxsize=8)
+def _load_pdf_lines_cached(
+    pdf_path: str, signature: Optional[Tuple[int, int]]
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    problems: List[str] = []
+    lines = tuple(_iter_clean_lines(_iter_pdf_lines(pdf_path, problems)))
+    return lines, tuple(problems)
+
+
+def _load_pdf_lines(pdf_path: str, label: str) -> Tuple[str, ...]:
+    """
+    Return the cleaned content lines of a PDF, parsing each file only once.
+
+    Keyed on path plus (size, mtime) so a rewritten file is re-read. When a test's
+    questions and answers live in the same PDF, the second extractor reuses the
+    first one's lines. The tuple is immutable, so it is safe to share. Parse
+    problems are printed prefixed with `label` on every call, cached or not.
+    """
+    try:
+        st = os.stat(pdf_path)
+        signature: Optional[Tuple[int, int]] = (st.st_size, st.st_mtime_ns)
+    except OSError:
+        signature = None
+    lines, problems = _load_pdf_lines_cached(pdf_path, signature)
+    for msg in problems:
+        print(f"({label}) {msg}")
+    return lines
+
+
+def _finalize_question(q: Optional[Dict[str, Any]], out: List[Dict[str, Any]]) -> None:
+    """Join a parsed question block's line parts and append it to ``out`` (no-op for None)."""
+    if q is None:
+        return
+    out.append({
+        "number": q["number"],
+        # Parts are already whitespace-normalized lines, so joining is enough
+        "text": " ".join(q["text_parts"]).strip(),
+        "options": {k: " ".join(parts).strip() for k, parts in q["options"].items()},
+    })
+
+
+def _store_answer(
+    answers: Dict[int, Dict[str, str]],
+    num: Optional[int],
+    correct: str,
+    expl_lines: List[str],
+) -> None:
+    """Record a parsed answer block in ``answers`` (no-op when ``num`` is None)."""
+    if num is None:
+        return
+    answers[num] = {
+        "correct": correct,
+        "explanation": " ".join(expl_lines).strip(),
+    }
+
 
 def extract_questions(pdf_path: str) -> List[Dict[str, Any]]:
     """
@@ -65,85 +340,29 @@ def extract_questions(pdf_path: str) -> List[Dict[str, Any]]:
         print(f"(extract_questions) File not found: {pdf_path}")
         return []
 
-    lines: List[str] = []
-    text: Optional[str] = None
-
-    # Prefer pdfplumber; fallback to pypdf text extraction
-    try:
-        import pdfplumber  # type: ignore
-
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text() or ""
-                if page_text:
-                    lines.extend(page_text.splitlines())
-    except Exception as e:
-        # Fallback to pypdf
-        try:
-            from pypdf import PdfReader  # type: ignore
-
-            reader = PdfReader(pdf_path)
-            for page in reader.pages:
-                page_text = page.extract_text() or ""
-                if page_text:
-                    lines.extend(page_text.splitlines())
-        except Exception as e2:
-            print(f"(extract_questions) Could not parse PDF using pdfplumber or pypdf: {e} / {e2}")
-            return []
-
-    # Normalize whitespace
-    norm_lines = [re.sub(r"\s+", " ", ln).strip() for ln in lines]
-
     questions: List[Dict[str, Any]] = []
     current_q: Optional[Dict[str, Any]] = None
     collecting_options = False
     current_option_letter: Optional[str] = None
 
-    # Regexes
-    # Allow optional leading page/line numbers and different delimiters for questions
-    # Examples matched: "18) ...", "18 . ...", "18- ...", and lines like "18 18) ..."
-    q_re = re.compile(r"^\s*(?:\d+\s+)?(\d+)\s*[\)\.-]\s*(.*)")
-    # Accept A) A. A: variants, with optional leading spaces
-    opt_re = re.compile(r"^\s*([A-G])\s*[\)\.:]\s*(.+)")
-
-    # Cleanup helper to strip page footer artifacts like "41/117" at end of line
-    page_footer_re = re.compile(r"\b\d{1,4}\s*/\s*\d{1,4}\b$")
-    def clean_line(s: str) -> str:
-        s2 = s.strip()
-        s2 = re.sub(page_footer_re, "", s2).strip()
-        return s2
-
-    def finalize_current():
-        nonlocal current_q
-        if current_q is not None:
-            # Trim text
-            current_q["text"] = re.sub(r"\s+", " ", current_q.get("text", "").strip())
-            # Trim options
-            opts = current_q.get("options", {})
-            for k, v in list(opts.items()):
-                opts[k] = re.sub(r"\s+", " ", v.strip())
-            questions.append(current_q)
-            current_q = None
-
-    for raw in norm_lines:
-        raw = clean_line(raw)
-        if not raw:
-            # Ignore blank lines
-            continue
-
+    for raw in _load_pdf_lines(pdf_path, "extract_questions"):
         # Skip common non-content headers that sometimes appear between question text and options
         if raw.lower() in {"options", "option", "answer choices", "answers"}:
             continue
 
-        m_q = q_re.match(raw)
+        # Lines are pre-stripped, so the first character decides which head
+        # pattern can possibly match; most continuation lines skip both.
+        first = raw[0]
+        m_q = _Q_RE.match(raw) if first.isdigit() else None
         if m_q:
             # New question starts; finalize previous
-            finalize_current()
+            _finalize_question(current_q, questions)
             num = int(m_q.group(1))
             q_text_initial = m_q.group(2).strip()
+            # Text and options accumulate as line lists, joined once on finalize
             current_q = {
                 "number": num,
-                "text": q_text_initial,
+                "text_parts": [q_text_initial] if q_text_initial else [],
                 "options": {},
             }
             collecting_options = False
@@ -154,35 +373,33 @@ def extract_questions(pdf_path: str) -> List[Dict[str, Any]]:
             # Not inside a question block; skip
             continue
 
-        m_opt = opt_re.match(raw)
+        m_opt = _OPT_RE.match(raw) if "A" <= first <= "G" else None
         if m_opt:
             collecting_options = True
             current_option_letter = m_opt.group(1)
-            current_q["options"][current_option_letter] = m_opt.group(2).strip()
+            current_q["options"][current_option_letter] = [m_opt.group(2).strip()]
             continue
 
         # If we are collecting options, treat non-matching lines as continuation of last option
         if collecting_options and current_option_letter is not None:
-            prev = current_q["options"].get(current_option_letter, "")
-            # Join with space
-            current_q["options"][current_option_letter] = (prev + " " + raw).strip()
+            current_q["options"][current_option_letter].append(raw)
         else:
             # Otherwise, it's additional question text
-            prev_q_text = current_q.get("text", "")
-            current_q["text"] = (prev_q_text + " " + raw).strip()
+            current_q["text_parts"].append(raw)
 
     # finalize tail
-    finalize_current()
+    _finalize_question(current_q, questions)
 
     # Post-process: handle special cases flags
     for q in questions:
         q_text = q.get("text", "")
-        if "<<IMAGE>>" in q_text or "drag and drop" in q_text.lower():
+        lc = q_text.lower()
+        if "<<IMAGE>>" in q_text or "drag and drop" in lc:
             q.setdefault("requires_manual_review", True)
             q.setdefault("note", "Contains image or interactive element")
 
         # Detect choose two/three for downstream validation
-        if re.search(r"\(choose\s+(two|three)\)", q_text, re.IGNORECASE):
+        if "choose" in lc and _CHOOSE_RE.search(q_text):
             q.setdefault("choose_multi", True)
 
     return questions
@@ -212,68 +429,16 @@ def extract_answers(pdf_path: str) -> Dict[int, Dict[str, str]]:
         print(f"(extract_answers) File not found: {pdf_path}")
         return {}
 
-    lines: List[str] = []
-
-    # Prefer pdfplumber; fallback to pypdf
-    try:
-        import pdfplumber  # type: ignore
-
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text() or ""
-                if page_text:
-                    lines.extend(page_text.splitlines())
-    except Exception as e:
-        try:
-            from pypdf import PdfReader  # type: ignore
-
-            reader = PdfReader(pdf_path)
-            for page in reader.pages:
-                page_text = page.extract_text() or ""
-                if page_text:
-                    lines.extend(page_text.splitlines())
-        except Exception as e2:
-            print(f"(extract_answers) Could not parse PDF using pdfplumber or pypdf: {e} / {e2}")
-            return {}
-
-    norm_lines = [re.sub(r"\s+", " ", ln).strip() for ln in lines]
-
-    # Pattern: number, letters (comma-separated), explanation start
-    # Allow: "51 C ...", "51) C ...", "51. C ...", and multi answers with optional spaces: "A, B, C"
-    # Allow head lines without immediate explanation text (e.g., "33 C")
-    head_re = re.compile(r"^(\d+)\s*[\.)-]?\s+([A-G](?:\s*,\s*[A-G])*)(?:\s+(.+))?$")
-    page_footer_re = re.compile(r"\b\d{1,4}\s*/\s*\d{1,4}\b$")
-    def _clean_answer_line(s: str) -> str:
-        s2 = s.strip()
-        s2 = re.sub(page_footer_re, "", s2).strip()
-        return s2
-
     answers: Dict[int, Dict[str, str]] = {}
     current_num: Optional[int] = None
     current_correct: str = ""
     current_expl_lines: List[str] = []
 
-    def flush_current():
-        nonlocal current_num, current_correct, current_expl_lines
-        if current_num is not None:
-            explanation = re.sub(r"\s+", " ", " ".join(current_expl_lines).strip())
-            answers[current_num] = {
-                "correct": current_correct,
-                "explanation": explanation,
-            }
-        current_num = None
-        current_correct = ""
-        current_expl_lines = []
-
-    for raw in norm_lines:
-        raw = _clean_answer_line(raw)
-        if not raw:
-            continue
-
-        m = head_re.match(raw)
+    for raw in _load_pdf_lines(pdf_path, "extract_answers"):
+        m = _HEAD_RE.match(raw)
         if m:
             # New answer block
-            flush_current()
+            _store_answer(answers, current_num, current_correct, current_expl_lines)
             current_num = int(m.group(1))
             current_correct = m.group(2).upper().replace(" ", "")
             expl_start = (m.group(3) or "").strip()
@@ -285,7 +450,7 @@ def extract_answers(pdf_path: str) -> Dict[int, Dict[str, str]]:
             current_expl_lines.append(raw)
 
     # Flush tail
-    flush_current()
+    _store_answer(answers, current_num, current_correct, current_expl_lines)
 
     return answers
 
@@ -305,6 +470,7 @@ def match_questions_answers(
         
     Returns:
         List of matched items, each containing 'question' and 'answer' dicts
+        (plus private lowercased '_qtext_lc'/'_combined_lc' strings for the classifiers)
         
     Example:
         >>> matched = match_questions_answers(questions, answers)
@@ -325,9 +491,13 @@ def match_questions_answers(
             if letter not in q.get("options", {}):
                 print(f"ERROR: Q{q_num} answer {letter} not in options")
 
+        explanation = answers[q_num].get("explanation", "")
         matched_data.append({
             "question": q,
             "answer": answers[q_num],
+            # Lowercased once here for the keyword classifiers; not emitted in output
+            "_qtext_lc": q["text"].lower(),
+            "_combined_lc": f"{q['text']} {explanation}".lower(),
         })
 
     return matched_data
@@ -350,34 +520,16 @@ def classify_topic(item: Dict[str, Any]) -> str:
         >>> classify_topic({'question': {'text': 'What is a sprint?'}, 'answer': {'explanation': '...'}})
         'Agile Frameworks/Methodologies'
     """
-    question_text = item["question"]["text"].lower()
-    explanation = item["answer"].get("explanation", "").lower()
-    combined = f"{question_text} {explanation}"
-
-    agile_keywords = [
-        'scrum', 'sprint', 'agile', 'kanban', 'retrospective',
-        'product owner', 'scrum master', 'user story', 'backlog',
-        'iteration', 'adaptive', 'daily standup', 'velocity',
-        'burndown', 'mvp', 'minimum viable product'
-    ]
-
-    predictive_keywords = [
-        'waterfall', 'predictive', 'wbs', 'work breakdown',
-        'gantt', 'critical path', 'baseline', 'change control board',
-        'traditional', 'plan-driven'
-    ]
-
-    ba_keywords = [
-        'requirements', 'business case', 'roi', 'stakeholder analysis',
-        'swot', 'traceability matrix', 'elicitation', 'moscow',
-        'weighted ranking', 'business analyst', 'feasibility'
-    ]
-
-    if any(k in combined for k in agile_keywords):
+    combined = item.get("_combined_lc")
+    if combined is None:
+        combined = f"{item['question']['text']} {item['answer'].get('explanation', '')}".lower()
+
+    tags = _keyword_tags(combined)
+    if "agile" in tags:
         return "Agile Frameworks/Methodologies"
-    if any(k in combined for k in predictive_keywords):
+    if "predictive" in tags:
         return "Predictive, Plan-Based Methodologies"
-    if any(k in combined for k in ba_keywords):
+    if "ba" in tags:
         return "Business Analysis Frameworks"
     return "Project Management Fundamentals and Core Concepts"
 
@@ -415,11 +567,10 @@ def estimate_difficulty(item: Dict[str, Any]) -> str:
     if "," in item["answer"].get("correct", ""):
         difficulty_score += 2
 
-    complex_keywords = [
-        'root cause', 'best practice', 'most appropriate',
-        'complex', 'integrate', 'conflict', 'hybrid'
-    ]
-    if any(keyword in q_text.lower() for keyword in complex_keywords):
+    q_text_lc = item.get("_qtext_lc")
+    if q_text_lc is None:
+        q_text_lc = q_text.lower()
+    if "complex" in _keyword_tags(q_text_lc):
         difficulty_score += 1
 
     if difficulty_score <= 1:
@@ -430,57 +581,223 @@ def estimate_difficulty(item: Dict[str, Any]) -> str:
         return "hard"
 
 
+def _text_hash(text: str) -> int:
+    """64-bit hash of normalized text, as a signed int so it fits an SQLite INTEGER."""
+    data = text.lower().encode('utf-8')
+    if xxhash is not None:
+        h = xxhash.xxh3_64_intdigest(data)
+    else:
+        h = int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'big')
+    return h - (1 << 64) if h >= (1 << 63) else h
+
+
+def _classifier_fingerprint() -> str:
+    """Digest of every tunable input the classifiers read, so stale memo rows can be detected."""
+    inputs = (
+        CLASSIFIER_VERSION,
+        AGILE_KEYWORDS, PREDICTIVE_KEYWORDS, BA_KEYWORDS, COMPLEX_KEYWORDS,
+        LONG_QUESTION_THRESHOLD, LONG_EXPLANATION_THRESHOLD,
+    )
+    return hashlib.blake2b(repr(inputs).encode('utf-8'), digest_size=8).hexdigest()
+
+
+class ClassificationCache:
+    """
+    Memo of (topic, difficulty) per question, keyed by a hash of its text.
+
+    Always keeps a bounded in-memory LRU. When `path` is given, results are also
+    stored in an SQLite table so re-runs over unchanged questions skip the keyword
+    scans; inserts are committed in batches of `commit_every` to amortize fsync.
+    The table is cleared when the classifier fingerprint (keywords, thresholds,
+    CLASSIFIER_VERSION) differs from the one it was filled under.
+    """
+
+    def __init__(self, path: Optional[str] = None, maxsize: int = 65536, commit_every: int = 512):
+        self.maxsize = maxsize
+        self.commit_every = commit_every
+        self._memo: "OrderedDict[int, Tuple[str, str]]" = OrderedDict()
+        self._pending = 0
+        self._db: Optional[sqlite3.Connection] = None
+        self._fingerprint = _classifier_fingerprint()
+        if path:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            # Parallel test workers share the file; wait on their commits rather than fail
+            self._db = sqlite3.connect(path, timeout=30)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS memo(h INTEGER PRIMARY KEY, topic TEXT, difficulty TEXT)"
+            )
+            self._db.execute("CREATE TABLE IF NOT EXISTS meta(k TEXT PRIMARY KEY, v TEXT)")
+            row = self._db.execute("SELECT v FROM meta WHERE k = 'fingerprint'").fetchone()
+            if row is None or row[0] != self._fingerprint:
+                self._db.execute("DELETE FROM memo")
+                self._db.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('fingerprint', ?)", (self._fingerprint,)
+                )
+                self._db.commit()
+
+    def get_or_compute(self, key_text: str, compute: Callable[[], Tuple[str, str]]) -> Tuple[str, str]:
+        h = _text_hash(f"{self._fingerprint}\x1f{key_text}")
+        hit = self._memo.get(h)
+        if hit is not None:
+            self._memo.move_to_end(h)
+            return hit
+        if self._db is not None:
+            row = self._db.execute("SELECT topic, difficulty FROM memo WHERE h = ?", (h,)).fetchone()
+            if row is not None:
+                hit = (row[0], row[1])
+        if hit is None:
+            hit = compute()
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO memo VALUES (?, ?, ?)", (h, hit[0], hit[1]))
+                self._pending += 1
+                if self._pending >= self.commit_every:
+                    self.flush()
+        self._memo[h] = hit
+        if len(self._memo) > self.maxsize:
+            self._memo.popitem(last=False)
+        return hit
+
+    def flush(self) -> None:
+        if self._db is not None and self._pending:
+            self._db.commit()
+            self._pending = 0
+
+    def close(self) -> None:
+        if self._db is not None:
+            self.flush()
+            self._db.close()
+            self._db = None
+
+
+# Only set when --classify-cache is given: process_test classifies each item once,
+# so an in-memory memo alone would only add hashing and misses.
+_classify_cache: Optional[ClassificationCache] = None
+
+
+def classify_item(item: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Return (topic, difficulty) for a matched item.
+
+    With a classification cache enabled, results are memoized on a key covering
+    everything the two classifiers read: question text, explanation, and correct answer.
+    """
+    if _classify_cache is None:
+        return classify_topic(item), estimate_difficulty(item)
+    key_text = "\x1f".join((
+        item["question"]["text"],
+        item["answer"].get("explanation", ""),
+        item["answer"].get("correct", ""),
+    ))
+    return _classify_cache.get_or_compute(
+        key_text, lambda: (classify_topic(item), estimate_difficulty(item))
+    )
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode obj as indented UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _json_item(item: Dict[str, Any], test_name: str) -> Dict[str, Any]:
+    """Build one output record from a matched question/answer item."""
+    topic, difficulty = classify_item(item)
+    return {
+        "text": f"[{test_name}] {item['question'].get('number', 0)}) {item['question']['text']}",
+        "options": item["question"].get("options", {}),
+        "correctAnswer": item["answer"].get("correct", ""),
+        "explanation": item["answer"].get("explanation", ""),
+        "topic": topic,
+        "difficulty": difficulty,
+    }
+
+
+def index_by_number(matched_data: List[Dict[str, Any]]) -> Dict[int, List[Tuple[int, Dict[str, Any]]]]:
+    """
+    Group matched items by question number as (extraction position, item) pairs.
+    """
+    by_num: Dict[int, List[Tuple[int, Dict[str, Any]]]] = {}
+    for pos, item in enumerate(matched_data):
+        by_num.setdefault(item["question"].get("number", 0), []).append((pos, item))
+    return by_num
+
+
+def create_json_structure_indexed(
+    by_num: Dict[int, List[Tuple[int, Dict[str, Any]]]], test_name: str, batch_start: int, batch_end: int
+) -> List[Dict[str, Any]]:
+    """
+    Like create_json_structure, but reads only the batch's range from an index_by_number() map.
+
+    Records keep extraction order, as with a full scan of the matched list.
+    """
+    hits: List[Tuple[int, Dict[str, Any]]] = []
+    for num in range(batch_start, batch_end + 1):
+        hits.extend(by_num.get(num, ()))
+    hits.sort(key=itemgetter(0))
+
+    return [_json_item(item, test_name) for _, item in hits]
+
+
+def _write_bytes(job: Tuple[str, bytes]) -> None:
+    path, payload = job
+    with open(path, 'wb') as f:
+        f.write(payload)
+
+
 def create_json_structure(
     matched_data: List[Dict[str, Any]], test_name: str, batch_start: int, batch_end: int
 ) -> List[Dict[str, Any]]:
     """
     Transform matched data into target JSON format.
     """
-    json_output: List[Dict[str, Any]] = []
-
-    for item in matched_data:
-        num = item["question"].get("number", 0)
-        if batch_start <= num <= batch_end:
-            json_output.append({
-                "text": f"[{test_name}] {num}) {item['question']['text']}",
-                "options": item["question"].get("options", {}),
-                "correctAnswer": item["answer"].get("correct", ""),
-                "explanation": item["answer"].get("explanation", ""),
-                "topic": classify_topic(item),
-                "difficulty": estimate_difficulty(item),
-            })
+    return create_json_structure_indexed(index_by_number(matched_data), test_name, batch_start, batch_end)
 
-    return json_output
 
-
-def validate_json_output(json_file: str) -> bool:
+def collect_validation_issues(json_file: str) -> List[str]:
     """
-    Validate generated JSON for quality and completeness.
+    Load a generated JSON file and return its quality issues without printing.
     """
     with open(json_file, 'r', encoding='utf-8') as f:
         data = json.load(f)
+    return _validate_items(data)
+
 
+def _validate_items(data: List[Dict[str, Any]]) -> List[str]:
+    """
+    Return quality issues for a list of output records (in memory or loaded from disk).
+    """
     issues: List[str] = []
 
     for idx, item in enumerate(data):
         q_num = idx + 1
-        required_fields = ['text', 'options', 'correctAnswer', 'explanation', 'topic', 'difficulty']
-        for field in required_fields:
-            if field not in item or not item[field]:
+        for field in _REQUIRED_FIELDS:
+            if not item.get(field):
                 issues.append(f"Q{q_num}: Missing or empty {field}")
-        if not item.get('text', '').startswith('[Practice Test'):
+        if not item.get('text', '').startswith(_TEXT_PREFIX):
             issues.append(f"Q{q_num}: Text doesn't start with [Practice Test X]")
-        answer = item.get('correctAnswer', '')
-        for letter in [l.strip() for l in answer.split(',') if l.strip()]:
-            if letter not in item.get('options', {}):
+        options = item.get('options', {})
+        for letter in item.get('correctAnswer', '').split(','):
+            letter = letter.strip()
+            if letter and letter not in options:
                 issues.append(f"Q{q_num}: Answer {letter} not in options")
         if len(item.get('explanation', '')) < MIN_EXPLANATION_LENGTH:
             issues.append(f"Q{q_num}: Explanation too short (< {MIN_EXPLANATION_LENGTH} chars)")
-        if item.get('topic') not in VALID_TOPICS:
-            issues.append(f"Q{q_num}: Invalid topic '{item.get('topic')}'")
-        if item.get('difficulty') not in ['easy', 'medium', 'hard']:
-            issues.append(f"Q{q_num}: Invalid difficulty '{item.get('difficulty')}'")
+        topic = item.get('topic')
+        # isinstance guard: malformed input (e.g. a list) must be reported, not raise on hashing
+        if not isinstance(topic, str) or topic not in _VALID_TOPICS:
+            issues.append(f"Q{q_num}: Invalid topic '{topic}'")
+        difficulty = item.get('difficulty')
+        if not isinstance(difficulty, str) or difficulty not in _VALID_DIFFICULTY:
+            issues.append(f"Q{q_num}: Invalid difficulty '{difficulty}'")
+
+    return issues
+
 
+def report_validation(json_file: str, issues: List[str]) -> bool:
+    """
+    Print the validation result for json_file. Returns True if there were no issues.
+    """
     if issues:
         print(f"❌ Validation failed for {json_file}:")
         for issue in issues:
@@ -491,15 +808,25 @@ def validate_json_output(json_file: str) -> bool:
         return True
 
 
+def validate_json_output(json_file: str) -> bool:
+    """
+    Validate generated JSON for quality and completeness.
+    """
+    return report_validation(json_file, collect_validation_issues(json_file))
+
+
 def process_test(
     test_name: str,
     questions_pdf: str,
     answers_pdf: str,
     batch_size: int = 15,
     strict_paths: bool = False,
-) -> None:
+) -> List[Tuple[str, List[str]]]:
     """
     Main processing pipeline for a single test.
+
+    Each batch is validated in memory before it is written; returns the
+    (output_path, issues) pairs so callers can report them.
     """
     print(f"Processing {test_name}...")
 
@@ -558,7 +885,7 @@ def process_test(
             missing.append(f"answers: {a_path}")
         if missing:
             print(f"(strict) Skipping {test_name} due to missing path(s): {', '.join(missing)}")
-            return
+            return []
     else:
         q_path = _resolve_pdf_path('questions', questions_pdf)
         a_path = _resolve_pdf_path('answers', answers_pdf)
@@ -572,23 +899,112 @@ def process_test(
     if not matched:
         print(f"No matched questions for {test_name}; skipping JSON emission.")
         print()
-        return
+        return []
 
-    nums = sorted(item["question"].get("number", 0) for item in matched)
-    min_num = nums[0]
-    max_num = nums[-1]
+    by_num = index_by_number(matched)
+    min_num = min(by_num)
+    max_num = max(by_num)
 
+    os.makedirs('output', exist_ok=True)
+    writes: List[Tuple[str, bytes]] = []
+    created: List[str] = []
+    validations: List[Tuple[str, List[str]]] = []
     for start in range(min_num, max_num + 1, batch_size):
         end = min(start + batch_size - 1, max_num)
-        batch_data = create_json_structure(matched, test_name, start, end)
+        batch_data = create_json_structure_indexed(by_num, test_name, start, end)
         filename = f"CAPM_{test_name.replace(' ', '_')}_Questions_{start}-{end}.json"
         output_path = os.path.join('output', filename)
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(batch_data, f, indent=2, ensure_ascii=False)
-        print(f"Created: {filename} ({len(batch_data)} questions)")
+        validations.append((output_path, _validate_items(batch_data)))
+        writes.append((output_path, _json_dumps(batch_data)))
+        created.append(f"Created: {filename} ({len(batch_data)} questions)")
+
+    # Encoding stays serial; only the file writes overlap
+    if len(writes) > 1:
+        with ThreadPoolExecutor(max_workers=min(MAX_WRITE_WORKERS, len(writes))) as ex:
+            list(ex.map(_write_bytes, writes))
+    else:
+        for job in writes:
+            _write_bytes(job)
+    for line in created:
+        print(line)
 
     print(f"✅ {test_name} complete!\n")
+    return validations
+
+
+def _init_worker(classify_cache_path: Optional[str]) -> None:
+    """Give each process its own classification cache (SQLite connections can't cross processes)."""
+    global _classify_cache
+    _classify_cache = ClassificationCache(classify_cache_path) if classify_cache_path else None
+
+
+def _process_test_job(
+    kwargs: Dict[str, Any]
+) -> Tuple[List[Tuple[str, List[str]]], str, Optional[str]]:
+    """
+    Worker entry point: run one test, then commit any new classification results.
+
+    The test's console output is captured rather than written to the shared stdout,
+    so the parent can print each test's lines as one block. Returns
+    (validations, output, error message or None).
+    """
+    buf = io.StringIO()
+    validations: List[Tuple[str, List[str]]] = []
+    error: Optional[str] = None
+    try:
+        with contextlib.redirect_stdout(buf):
+            validations = process_test(**kwargs)
+    except Exception as e:
+        error = str(e)
+    finally:
+        if _classify_cache is not None:
+            _classify_cache.flush()
+    return validations, buf.getvalue(), error
+
+
+def run_tests(
+    jobs: List[Tuple[str, Dict[str, Any]]],
+    max_workers: Optional[int] = None,
+    classify_cache_path: Optional[str] = None,
+) -> List[Tuple[str, List[str]]]:
+    """
+    Run process_test for each (test_name, kwargs) job.
+
+    Tests are independent (own PDFs, own output filenames), so with more than one
+    job and worker they run in a process pool; each test's output is printed as
+    one block when it finishes. Errors are reported per test.
+    Returns the (output_path, issues) pairs of every batch written.
+    """
+    validations: List[Tuple[str, List[str]]] = []
+    workers = min(len(jobs), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        _init_worker(classify_cache_path)
+        try:
+            for name, kwargs in jobs:
+                try:
+                    validations.extend(process_test(**kwargs))
+                except Exception as e:
+                    print(f"❌ Error processing {name}: {e}")
+        finally:
+            if _classify_cache is not None:
+                _classify_cache.close()
+        return validations
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(classify_cache_path,)
+    ) as ex:
+        futures = {ex.submit(_process_test_job, kwargs): name for name, kwargs in jobs}
+        for f in as_completed(futures):
+            try:
+                job_validations, output, error = f.result()
+            except Exception as e:
+                print(f"❌ Error processing {futures[f]}: {e}")
+                continue
+            print(output, end="")
+            if error is not None:
+                print(f"❌ Error processing {futures[f]}: {error}")
+            validations.extend(job_validations)
+    return validations
 
 
 def load_config(config_path: str) -> Dict[str, Any]:
@@ -612,6 +1028,10 @@ def main() -> None:
     parser.add_argument('--config', default='config.json', help='Path to config.json')
     parser.add_argument('--skip-tests', action='store_true', help='Skip quick test_extraction()')
     parser.add_argument('--strict-paths', action='store_true', help='Do not resolve missing paths; skip tests if configured PDFs are absent')
+    parser.add_argument('--classify-cache', nargs='?', const=DEFAULT_CLASSIFY_CACHE, default=None, metavar='PATH',
+                        help=f'Persist topic/difficulty results in an SQLite file across runs (default path: {DEFAULT_CLASSIFY_CACHE})')
+    parser.add_argument('--jobs', type=int, default=None, metavar='N',
+                        help='Process up to N tests in parallel (default: one per CPU; 1 runs serially)')
     args = parser.parse_args()
 
     if not args.skip_tests:
@@ -627,28 +1047,29 @@ def main() -> None:
         print("No tests configured in config.json")
         return
 
+    jobs: List[Tuple[str, Dict[str, Any]]] = []
     for test in tests:
         try:
-            process_test(
+            jobs.append((test['name'], dict(
                 test_name=test['name'],
                 questions_pdf=test['questions'],
                 answers_pdf=test['answers'],
                 batch_size=int(test.get('batch_size', 15)),
                 strict_paths=bool(args.strict_paths),
-            )
+            )))
         except Exception as e:
             print(f"❌ Error processing {test.get('name', 'UNKNOWN')}: {e}")
-            continue
+
+    validations = run_tests(jobs, max_workers=args.jobs, classify_cache_path=args.classify_cache)
 
     print("\n" + "=" * 50)
     print("VALIDATION PHASE")
     print("=" * 50 + "\n")
 
-    output_files = glob.glob('output/*.json')
+    # Batches were validated in memory before writing; no need to re-read them
     all_valid = True
-
-    for json_file in sorted(output_files):
-        if not validate_json_output(json_file):
+    for json_file, issues in sorted(validations):
+        if not report_validation(json_file, issues):
             all_valid = False
 
     print("\n" + "=" * 50)
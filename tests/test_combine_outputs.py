@@ -0,0 +1,161 @@
+import json
+
+import pytest
+
+import scripts.combine_outputs as co
+
+
+def _write_batch(dir_path, test_name, start, end, items):
+    name = f"CAPM_{test_name.replace(' ', '_')}_Questions_{start}-{end}.json"
+    (dir_path / name).write_text(json.dumps(items), encoding='utf-8')
+
+
+def test_detect_and_combine_batches_sorted_by_range(tmp_path):
+    _write_batch(tmp_path, 'Practice Test 2', 16, 30, [{"text": "q16"}])
+    _write_batch(tmp_path, 'Practice Test 2', 1, 15, [{"text": "q1"}])
+    _write_batch(tmp_path, 'Practice Test 3', 1, 15, [{"text": "p3"}])
+    # Non-batch files are ignored by the scanner
+    (tmp_path / "CAPM_Practice_Test_2_All.json").write_text("[]", encoding='utf-8')
+    (tmp_path / "notes.txt").write_text("x", encoding='utf-8')
+
+    assert co.detect_tests_in_output(str(tmp_path)) == ['Practice Test 2', 'Practice Test 3']
+
+    out = co.combine_batches('Practice Test 2', str(tmp_path))
+    with open(out, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    assert [d["text"] for d in data] == ["q1", "q16"]
+
+
+def test_detect_tests_missing_dir(tmp_path):
+    assert co.detect_tests_in_output(str(tmp_path / "missing")) == []
+
+
+def test_combine_all_tests_adds_test_name(tmp_path):
+    _write_batch(tmp_path, 'Practice Test 2', 1, 15, [{"text": "a"}, {"text": "b"}])
+    _write_batch(tmp_path, 'Practice Test 3', 1, 15, [{"text": "c"}])
+
+    out = co.combine_all_tests(['Practice Test 2', 'Practice Test 3'], str(tmp_path))
+    with open(out, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    assert [(d["text"], d["testName"]) for d in data] == [
+        ("a", "Practice Test 2"),
+        ("b", "Practice Test 2"),
+        ("c", "Practice Test 3"),
+    ]
+
+
+def test_combine_batches_parallel_load_keeps_order(tmp_path):
+    for i in range(6):
+        start = i * 15 + 1
+        _write_batch(tmp_path, 'Practice Test 4', start, start + 14, [{"text": f"q{start}"}])
+
+    out = co.combine_batches('Practice Test 4', str(tmp_path))
+    with open(out, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    assert [d["text"] for d in data] == [f"q{i * 15 + 1}" for i in range(6)]
+
+
+def test_combine_batches_skips_unchanged_inputs(tmp_path, capsys):
+    _write_batch(tmp_path, 'Practice Test 5', 1, 15, [{"text": "a"}])
+    out = co.combine_batches('Practice Test 5', str(tmp_path))
+    capsys.readouterr()
+
+    co.combine_batches('Practice Test 5', str(tmp_path))
+    assert "Up to date" in capsys.readouterr().out
+
+    _write_batch(tmp_path, 'Practice Test 5', 16, 30, [{"text": "b"}])
+    co.combine_batches('Practice Test 5', str(tmp_path))
+    assert "Combined 2 files" in capsys.readouterr().out
+    with open(out, 'r', encoding='utf-8') as f:
+        assert [d["text"] for d in json.load(f)] == ["a", "b"]
+
+
+def test_combine_all_tests_jsonl(tmp_path):
+    _write_batch(tmp_path, 'Practice Test 2', 1, 15, [{"text": "a"}, {"text": "b"}])
+
+    out = co.combine_all_tests(['Practice Test 2'], str(tmp_path), jsonl=True)
+    assert out.endswith('CAPM_All_Tests.jsonl')
+    with open(out, 'r', encoding='utf-8') as f:
+        rows = [json.loads(line) for line in f]
+    assert rows == [
+        {"text": "a", "testName": "Practice Test 2"},
+        {"text": "b", "testName": "Practice Test 2"},
+    ]
+
+
+def test_combine_all_tests_per_test_outputs(tmp_path, capsys):
+    _write_batch(tmp_path, 'Practice Test 2', 1, 15, [{"text": "a"}])
+    _write_batch(tmp_path, 'Practice Test 3', 1, 15, [{"text": "c"}])
+
+    co.combine_all_tests(['Practice Test 2', 'Practice Test 3'], str(tmp_path), per_test=True)
+    with open(tmp_path / 'CAPM_Practice_Test_3_All.json', 'r', encoding='utf-8') as f:
+        assert json.load(f) == [{"text": "c"}]
+    capsys.readouterr()
+
+    # The per-test file is registered in the combine cache
+    co.combine_batches('Practice Test 2', str(tmp_path))
+    assert "Up to date" in capsys.readouterr().out
+
+
+def test_combine_all_tests_accepts_generator(tmp_path, capsys):
+    _write_batch(tmp_path, 'Practice Test 2', 1, 15, [{"text": "a"}])
+    _write_batch(tmp_path, 'Practice Test 3', 1, 15, [{"text": "c"}])
+
+    co.combine_all_tests((t for t in ['Practice Test 2', 'Practice Test 3']), str(tmp_path))
+    assert "across 2 tests" in capsys.readouterr().out
+
+
+def test_failed_combine_keeps_previous_output(tmp_path):
+    _write_batch(tmp_path, 'T', 1, 15, [{"text": "a"}])
+    _write_batch(tmp_path, 'T', 16, 30, [{"text": "b"}])
+    out = co.combine_batches('T', str(tmp_path))
+    all_tests = co.combine_all_tests(['T'], str(tmp_path), per_test=True)
+    before = {p: open(p, 'rb').read() for p in (out, all_tests)}
+
+    # A batch with a non-list root aborts the combine midway
+    (tmp_path / "CAPM_T_Questions_16-30.json").write_text('{"text": "b"}', encoding='utf-8')
+    with pytest.raises(ValueError):
+        co.combine_batches('T', str(tmp_path), use_cache=False)
+    with pytest.raises(ValueError):
+        co.combine_all_tests(['T'], str(tmp_path), per_test=True)
+
+    assert {p: open(p, 'rb').read() for p in (out, all_tests)} == before
+    assert not [p for p in tmp_path.iterdir() if p.name.endswith('.tmp')]
+    # The stale cache key is gone, so the next run rewrites instead of reporting "Up to date"
+    assert not (tmp_path / "CAPM_T_All.json.combine.cache").exists()
+
+
+def test_load_batches_bounds_read_ahead(monkeypatch):
+    loaded = []
+    monkeypatch.setattr(co, 'MAX_LOAD_WORKERS', 2)
+    monkeypatch.setattr(co, '_load_batch', lambda p: loaded.append(p) or [p])
+
+    batches = co._load_batches([f"f{i}" for i in range(20)])
+    assert next(batches) == ["f0"]
+    # 2 x workers submitted up front, plus one refill after the first result
+    assert len(loaded) <= 5
+    assert [b[0] for b in batches] == [f"f{i}" for i in range(1, 20)]
+
+
+def test_load_batch_uses_mmap_only_for_large_files(tmp_path, monkeypatch):
+    if co.orjson is None:
+        pytest.skip("mmap path requires orjson")
+    small = tmp_path / "small.json"
+    small.write_text(json.dumps([{"text": "a"}]), encoding='utf-8')
+    large = tmp_path / "large.json"
+    large.write_text(json.dumps([{"text": "x" * 64}] * 32), encoding='utf-8')
+    monkeypatch.setattr(co, 'MMAP_MIN_BYTES', 1024)
+
+    mapped = []
+    real_mmap = co.mmap.mmap
+
+    def spy_mmap(*args, **kwargs):
+        mapped.append(args)
+        return real_mmap(*args, **kwargs)
+
+    monkeypatch.setattr(co.mmap, 'mmap', spy_mmap)
+
+    assert co._load_batch(str(small)) == [{"text": "a"}]
+    assert mapped == []
+    assert co._load_batch(str(large)) == [{"text": "x" * 64}] * 32
+    assert len(mapped) == 1
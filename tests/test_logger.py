@@ -0,0 +1,34 @@
+from utils.logger import ExtractionLogger
+
+
+def test_warnings_buffered_and_formatted_lazily(capsys):
+    log = ExtractionLogger(flush_every=3)
+    log.warning("No answer found for Q%d", args=(7,))
+    log.info("step", "resolver")
+    assert capsys.readouterr().out == ""
+
+    log.info("done")
+    assert capsys.readouterr().out == (
+        "WARNING: No answer found for Q7\n(resolver) step\ndone\n"
+    )
+
+    log.error("Q%d answer %s not in options", args=(3, "E"))
+    log.summary()
+    captured = capsys.readouterr()
+    assert "ERROR: Q3 answer E not in options" in captured.err
+    assert "  - WARNING: No answer found for Q7" in captured.out
+    assert log.warnings == ["WARNING: No answer found for Q7"]
+    assert log.errors == ["ERROR: Q3 answer E not in options"]
+
+
+def test_bad_format_args_do_not_break_later_calls(capsys):
+    log = ExtractionLogger()
+    log.info("Q%d", args=("x",))
+    log.error("an error")
+    log.flush()
+    captured = capsys.readouterr()
+    assert "Q%d ('x',)" in captured.out
+    assert "ERROR: an error" in captured.err
+    log.info("after")
+    log.flush()
+    assert capsys.readouterr().out == "after\n"
@@ -1,6 +1,10 @@
 import types
 import sys
 import importlib
+import multiprocessing
+
+import pytest
+
 import scripts.extract_questions as eq
 
 class FakePage:
@@ -75,3 +79,195 @@ def test_extract_answers_parsing(monkeypatch):
     assert ans[77]['correct'] == 'A'
     assert ans[78]['correct'].replace(' ', '') == 'A,B,C'
     assert ans[79]['correct'] == 'D'
+
+
+def test_classification_cache_persists(tmp_path):
+    db = str(tmp_path / "memo.sqlite")
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return ("Agile Frameworks/Methodologies", "easy")
+
+    cache = eq.ClassificationCache(db)
+    assert cache.get_or_compute("What is a sprint?", compute) == ("Agile Frameworks/Methodologies", "easy")
+    assert cache.get_or_compute("What is a sprint?", compute) == ("Agile Frameworks/Methodologies", "easy")
+    cache.close()
+    assert len(calls) == 1
+
+    reopened = eq.ClassificationCache(db)
+    assert reopened.get_or_compute("What is a sprint?", compute) == ("Agile Frameworks/Methodologies", "easy")
+    reopened.close()
+    assert len(calls) == 1
+
+
+def test_same_pdf_parsed_once(monkeypatch):
+    opens = []
+    text = "\n".join(["1) Shared question?", "A) Yes", "B) No", "1 A Because the shared PDF says so."])
+
+    def fake_open(path):
+        opens.append(path)
+        return FakePDF([text])
+
+    monkeypatch.setitem(sys.modules, 'pdfplumber', types.SimpleNamespace(open=fake_open))
+    monkeypatch.setattr(eq.os.path, 'exists', lambda p: True)
+
+    importlib.reload(eq)
+    qs = eq.extract_questions("/dev/null.pdf")
+    ans = eq.extract_answers("/dev/null.pdf")
+
+    assert qs[0]['number'] == 1
+    assert ans[1]['correct'] == 'A'
+    assert len(opens) == 1
+
+
+def test_classify_topic_and_difficulty():
+    def item(text, expl="", correct="A"):
+        return {"question": {"text": text}, "answer": {"explanation": expl, "correct": correct}}
+
+    assert eq.classify_topic(item("What happens in a Sprint Review?")) == "Agile Frameworks/Methodologies"
+    assert eq.classify_topic(item("Which chart?", "Use a Gantt chart.")) == "Predictive, Plan-Based Methodologies"
+    assert eq.classify_topic(item("Compute the ROI")) == "Business Analysis Frameworks"
+    assert eq.classify_topic(item("Who signs the charter?")) == "Project Management Fundamentals and Core Concepts"
+    assert eq.estimate_difficulty(item("Find the root cause", correct="A,B")) == "medium"
+    assert eq.estimate_difficulty(item("Short?")) == "easy"
+
+
+def test_validation_reports_malformed_topic_and_difficulty():
+    item = {
+        "text": "[Practice Test 1] 1) Q",
+        "options": {"A": "x"},
+        "correctAnswer": "A",
+        "explanation": "e" * 120,
+        "topic": ["Agile Frameworks/Methodologies"],
+        "difficulty": {"level": "easy"},
+    }
+    issues = eq._validate_items([item])
+    assert any(i.startswith("Q1: Invalid topic") for i in issues)
+    assert any(i.startswith("Q1: Invalid difficulty") for i in issues)
+
+
+def test_batches_keep_extraction_order():
+    def item(num):
+        return {"question": {"number": num, "text": f"Q{num}", "options": {}},
+                "answer": {"correct": "A", "explanation": ""}}
+
+    matched = [item(3), item(1), item(2), item(1)]
+    by_num = eq.index_by_number(matched)
+    out = eq.create_json_structure_indexed(by_num, "Practice Test 1", 1, 3)
+    assert [r["text"] for r in out] == [
+        "[Practice Test 1] 3) Q3", "[Practice Test 1] 1) Q1",
+        "[Practice Test 1] 2) Q2", "[Practice Test 1] 1) Q1",
+    ]
+    assert out == eq.create_json_structure(matched, "Practice Test 1", 1, 3)
+
+
+def test_parse_failures_reported_with_caller_label(monkeypatch, capsys):
+    importlib.reload(eq)
+
+    def broken(path):
+        raise OSError("cannot open")
+        yield  # pragma: no cover - makes this a generator like the real backends
+
+    monkeypatch.setattr(eq, '_PDF_BACKENDS', (("fake", broken),))
+    monkeypatch.setattr(eq.os.path, 'exists', lambda p: True)
+    assert eq.extract_questions("/missing.pdf") == []
+    assert eq.extract_answers("/missing.pdf") == {}
+    out = capsys.readouterr().out
+    assert "(extract_questions) Could not parse PDF with any available parser: fake: cannot open" in out
+    assert "(extract_answers) Could not parse PDF" in out
+
+
+class FakePdfiumDoc:
+    def __init__(self, pages_texts):
+        self._pages = pages_texts
+
+    def __iter__(self):
+        for text in self._pages:
+            page = types.SimpleNamespace(close=lambda: None)
+            page.get_textpage = lambda text=text: types.SimpleNamespace(
+                get_text_range=lambda: text, close=lambda: None)
+            yield page
+
+    def close(self):
+        pass
+
+
+def _fake_backends(monkeypatch, pdfium_open):
+    plumber_opens = []
+
+    def plumber_open(path):
+        plumber_opens.append(path)
+        return FakePDF(["1) From pdfplumber?", "A) Yes"])
+
+    monkeypatch.setitem(sys.modules, 'pypdfium2', types.SimpleNamespace(PdfDocument=pdfium_open))
+    # Make pymupdf unavailable so the fallback lands on the pdfplumber mock
+    monkeypatch.setitem(sys.modules, 'pymupdf', None)
+    monkeypatch.setitem(sys.modules, 'fitz', None)
+    monkeypatch.setitem(sys.modules, 'pdfplumber', types.SimpleNamespace(open=plumber_open))
+    monkeypatch.setattr(eq.os.path, 'exists', lambda p: True)
+    importlib.reload(eq)
+    return plumber_opens
+
+
+def test_pdf_backend_order_prefers_pypdfium2(monkeypatch):
+    plumber_opens = _fake_backends(
+        monkeypatch, lambda path: FakePdfiumDoc(["1) From pdfium?", "A) Yes"]))
+    assert [name for name, _ in eq._PDF_BACKENDS] == ["pypdfium2", "pymupdf", "pdfplumber", "pypdf"]
+
+    qs = eq.extract_questions("/dev/null.pdf")
+    assert qs[0]['text'] == "From pdfium?"
+    assert plumber_opens == []
+
+
+def test_pdf_backend_falls_back_when_pypdfium2_fails(monkeypatch):
+    def pdfium_open(path):
+        raise RuntimeError("Failed to load document")
+
+    plumber_opens = _fake_backends(monkeypatch, pdfium_open)
+    qs = eq.extract_questions("/dev/null.pdf")
+    assert qs[0]['text'] == "From pdfplumber?"
+    assert plumber_opens == ["/dev/null.pdf"]
+
+
+def test_classification_cache_invalidated_by_keyword_change(tmp_path, monkeypatch):
+    db = str(tmp_path / "memo.sqlite")
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return ("Project Management Fundamentals and Core Concepts", "easy")
+
+    cache = eq.ClassificationCache(db)
+    cache.get_or_compute("Explain the charter", compute)
+    cache.close()
+
+    monkeypatch.setattr(eq, 'AGILE_KEYWORDS', eq.AGILE_KEYWORDS + ('charter',))
+    reopened = eq.ClassificationCache(db)
+    reopened.get_or_compute("Explain the charter", compute)
+    reopened.close()
+    assert len(calls) == 2
+
+
+def _fake_process_test(test_name, fail=False, **kwargs):
+    print(f"Processing {test_name}...")
+    print(f"WARNING: No answer found for Q12 in {test_name}")
+    if fail:
+        raise RuntimeError("bad PDF")
+    return [(f"output/{test_name}.json", [f"issue in {test_name}"])]
+
+
+def test_run_tests_pool_collects_validations_and_errors(monkeypatch, capsys):
+    if multiprocessing.get_start_method() != 'fork':
+        pytest.skip("workers must inherit the patched process_test")
+    importlib.reload(eq)
+    monkeypatch.setattr(eq, 'process_test', _fake_process_test)
+
+    jobs = [("T1", {"test_name": "T1"}), ("T2", {"test_name": "T2", "fail": True})]
+    validations = eq.run_tests(jobs, max_workers=2)
+
+    assert validations == [("output/T1.json", ["issue in T1"])]
+    out = capsys.readouterr().out
+    # Each test's lines stay together, and the error is attributed to its test
+    assert "Processing T1...\nWARNING: No answer found for Q12 in T1\n" in out
+    assert "Processing T2...\nWARNING: No answer found for Q12 in T2\n❌ Error processing T2: bad PDF\n" in out
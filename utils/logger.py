@@ -5,74 +5,119 @@ Provides consistent logging across extraction scripts with structured output.
 """
 
 import sys
-from typing import Optional
+import weakref
+from typing import List, Tuple
+
+# (label, prefix, message, args) — formatted only when written
+Record = Tuple[str, str, str, tuple]
+
+
+def _format(record: Record) -> str:
+    """Render a record; bad %-args are reported instead of raised, as `logging` does."""
+    label, prefix, message, args = record
+    prefix_str = f"({prefix}) " if prefix else ""
+    if args:
+        try:
+            message = message % args
+        except (TypeError, ValueError, KeyError) as e:
+            print(f"--- Logging error: {e} (message={message!r}, args={args!r})", file=sys.stderr)
+            message = f"{message} {args!r}"
+    return f"{label}{prefix_str}{message}"
+
+
+def _write_records(records: List[Record]) -> None:
+    """Write and clear pending records with a single write call."""
+    if not records:
+        return
+    try:
+        text = "".join(_format(r) + "\n" for r in records)
+    finally:
+        records.clear()
+    sys.stdout.write(text)
 
 
 class ExtractionLogger:
-    """Lightweight logger for extraction operations."""
-    
-    def __init__(self, verbose: bool = False):
+    """Lightweight logger for extraction operations.
+
+    Messages may use %-style placeholders with their values passed as `args`
+    (``log.info("Q%d done", args=(num,))``) so formatting is deferred until the
+    line is written. Stdout lines are buffered and written every `flush_every`
+    records, before any stderr output, and on summary().
+    """
+
+    def __init__(self, verbose: bool = False, flush_every: int = 64):
         """
         Initialize logger.
-        
+
         Args:
             verbose: If True, print detailed debug messages
+            flush_every: Number of buffered stdout lines written per batch
         """
         self.verbose = verbose
-        self.warnings = []
-        self.errors = []
-    
-    def info(self, message: str, prefix: str = "") -> None:
+        self.flush_every = flush_every
+        self.warnings: List[str] = []
+        self.errors: List[str] = []
+        self._pending: List[Record] = []
+        # Don't lose buffered lines if summary() is never called
+        self._finalizer = weakref.finalize(self, _write_records, self._pending)
+
+    def _emit(self, record: Record) -> None:
+        self._pending.append(record)
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered stdout lines."""
+        _write_records(self._pending)
+
+    def info(self, message: str, prefix: str = "", args: tuple = ()) -> None:
         """Print info message."""
-        prefix_str = f"({prefix}) " if prefix else ""
-        print(f"{prefix_str}{message}")
-    
-    def debug(self, message: str, prefix: str = "") -> None:
+        self._emit(("", prefix, message, args))
+
+    def debug(self, message: str, prefix: str = "", args: tuple = ()) -> None:
         """Print debug message if verbose enabled."""
-        if self.verbose:
-            prefix_str = f"({prefix}) " if prefix else ""
-            print(f"DEBUG: {prefix_str}{message}", file=sys.stderr)
-    
-    def warning(self, message: str, prefix: str = "") -> None:
+        if not self.verbose:
+            return
+        self.flush()
+        print(_format(("DEBUG: ", prefix, message, args)), file=sys.stderr)
+
+    def warning(self, message: str, prefix: str = "", args: tuple = ()) -> None:
         """Print warning and store for summary."""
-        prefix_str = f"({prefix}) " if prefix else ""
-        msg = f"WARNING: {prefix_str}{message}"
-        print(msg)
+        msg = _format(("WARNING: ", prefix, message, args))
+        self._emit(("", "", msg, ()))
         self.warnings.append(msg)
-    
-    def error(self, message: str, prefix: str = "") -> None:
+
+    def error(self, message: str, prefix: str = "", args: tuple = ()) -> None:
         """Print error and store for summary."""
-        prefix_str = f"({prefix}) " if prefix else ""
-        msg = f"ERROR: {prefix_str}{message}"
+        msg = _format(("ERROR: ", prefix, message, args))
+        self.flush()
         print(msg, file=sys.stderr)
         self.errors.append(msg)
-    
+
     def summary(self) -> None:
         """Print summary of warnings and errors."""
+        self.flush()
         if self.warnings or self.errors:
-            print("\n" + "=" * 50)
-            print("SUMMARY")
-            print("=" * 50)
-            
+            lines = ["", "=" * 50, "SUMMARY", "=" * 50]
+
             if self.warnings:
-                print(f"\nWarnings ({len(self.warnings)}):")
-                for w in self.warnings[:10]:  # Show first 10
-                    print(f"  - {w}")
+                lines.append(f"\nWarnings ({len(self.warnings)}):")
+                lines.extend(f"  - {w}" for w in self.warnings[:10])  # Show first 10
                 if len(self.warnings) > 10:
-                    print(f"  ... and {len(self.warnings) - 10} more")
-            
+                    lines.append(f"  ... and {len(self.warnings) - 10} more")
+
             if self.errors:
-                print(f"\nErrors ({len(self.errors)}):")
-                for e in self.errors[:10]:  # Show first 10
-                    print(f"  - {e}")
+                lines.append(f"\nErrors ({len(self.errors)}):")
+                lines.extend(f"  - {e}" for e in self.errors[:10])  # Show first 10
                 if len(self.errors) > 10:
-                    print(f"  ... and {len(self.errors) - 10} more")
-            print()
-    
+                    lines.append(f"  ... and {len(self.errors) - 10} more")
+            lines.append("")
+            sys.stdout.write("\n".join(lines) + "\n")
+
     def has_errors(self) -> bool:
         """Check if any errors were logged."""
         return len(self.errors) > 0
-    
+
     def reset(self) -> None:
         """Clear warning and error lists."""
         self.warnings.clear()